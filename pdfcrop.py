@@ -3,7 +3,7 @@
 Herramienta para recortar márgenes en blanco de documentos PDF página por página.
 
 Este script analiza cada página de un PDF, detecta el contenido no blanco mediante
-rasterización a una resolución especificada (DPI), calcula el cuadro delimitador
+rasterización a una resolución de detección (DPI) baja, calcula el cuadro delimitador
 (bounding box) del contenido y ajusta el cropbox de la página para eliminar
 márgenes innecesarios, conservando un margen configurable.
 
@@ -13,11 +13,35 @@ Dependencias:
 """
 
 import argparse
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import fitz  # PyMuPDF
 import numpy as np
 
+# Resolución y fracción central de la página del sondeo previo de `--probe-blank`.
+_PROBE_DPI = 36
+_PROBE_INSET = 0.2
+
+# Resolución a la que se interpretan los márgenes en "px" (el antiguo `--dpi` por
+# defecto), independiente de `--detect-dpi` para que "10px" no cambie de tamaño.
+_PX_DPI = 200
+
+# Longitud con unidad opcional, p. ej. "10mm", "2.5 in", "150".
+_LENGTH_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([a-z]*)\s*$")
+
+# Puntos PDF por unidad. "px" no aparece porque depende del DPI.
+_UNIT_TO_PT = {
+    "pt": 1.0,
+    "mm": 72.0 / 25.4,
+    "cm": 72.0 / 2.54,
+    "in": 72.0,
+    "inch": 72.0,
+    "inches": 72.0,
+}
+
 
 def parse_length_to_points(s: str, dpi: int) -> float:
     """Convierte una longitud con unidad a puntos PDF (pt).
@@ -51,34 +75,32 @@ def parse_length_to_points(s: str, dpi: int) -> float:
         150.0
     """
     s = s.strip().lower()
-    m = re.match(r"^\s*([0-9]*\.?[0-9]+)\s*([a-z]*)\s*$", s)
+    m = _LENGTH_RE.match(s)
     if not m:
         raise ValueError(f"Longitud inválida: {s}")
     val = float(m.group(1))
     unit = m.group(2) or "pt"
-    if unit == "pt":
-        return val
-    if unit == "mm":
-        return val * 72.0 / 25.4
-    if unit == "cm":
-        return val * 72.0 / 2.54
-    if unit in ("in", "inch", "inches"):
-        return val * 72.0
+    factor = _UNIT_TO_PT.get(unit)
+    if factor is not None:
+        return val * factor
     if unit == "px":
         if not dpi:
-            raise ValueError("Para 'px' se requiere --dpi.")
+            raise ValueError("Para 'px' se requiere un DPI de referencia.")
         return val * (72.0 / dpi)
     raise ValueError(f"Unidad no soportada: {unit}")
 
 
 def find_content_bbox(pix: fitz.Pixmap, threshold: int) -> tuple | None:
-    """Encuentra el cuadro delimitador (bounding box) del contenido no blanco en un pixmap en escala de grises.
+    """Encuentra el cuadro delimitador (bounding box) del contenido no blanco en un pixmap.
 
-    El contenido se define como cualquier píxel cuyo valor sea **menor** que `threshold`
-    (0 = negro, 255 = blanco). Se asume que el pixmap está en modo GRAY (sin canal alfa).
+    El contenido se define como cualquier píxel con algún canal **menor** que `threshold`
+    (0 = negro, 255 = blanco). En modo GRAY es simplemente la intensidad; en modo RGB
+    basta con que un canal quede por debajo, de modo que también se detectan colores
+    claros cuya luminancia supera el umbral (p. ej. un amarillo pálido). Se asume que
+    el pixmap no tiene canal alfa.
 
     Args:
-        pix (fitz.Pixmap): Pixmap en escala de grises (debe tener `pix.n == 1`).
+        pix (fitz.Pixmap): Pixmap en escala de grises (`pix.n == 1`) o RGB (`pix.n == 3`).
         threshold (int): Umbral de intensidad (0–255). Valores menores se consideran contenido.
 
     Returns:
@@ -86,7 +108,7 @@ def find_content_bbox(pix: fitz.Pixmap, threshold: int) -> tuple | None:
                       o `None` si no se detecta contenido (página en blanco).
 
     Raises:
-        ValueError: Si el pixmap no está en escala de grises (`pix.n != 1`).
+        ValueError: Si el pixmap no es GRAY ni RGB, o si tiene canal alfa.
 
     Examples:
         >>> doc = fitz.open("ejemplo.pdf")
@@ -96,90 +118,270 @@ def find_content_bbox(pix: fitz.Pixmap, threshold: int) -> tuple | None:
         >>> bbox = find_content_bbox(pix, threshold=245)
         >>> print(bbox)  # Ej: (10, 20, 500, 700)
     """
-    if pix.n != 1:
-        raise ValueError("El Pixmap debe ser en escala de grises (n=1).")
-    h, w = pix.height, pix.width
-    arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(h, w)
-    mask = arr < np.uint8(threshold)
-    if not mask.any():
+    if pix.alpha or pix.n not in (1, 3):
+        raise ValueError("El Pixmap debe ser GRAY (n=1) o RGB (n=3), sin canal alfa.")
+    h, w, n = pix.height, pix.width, pix.n
+    # Vista sobre el búfer del pixmap (`samples_mv`), sin copiar los bytes como hace
+    # `pix.samples`. Cada fila ocupa `pix.stride` bytes, que puede ser mayor que `w*n`.
+    # Los canales quedan intercalados en las columnas: la columna de bytes `c`
+    # pertenece al píxel `c // n`, así que no hace falta separarlos.
+    arr = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(h, pix.stride)[:, :w * n]
+    # Reducir directamente sobre uint8 (mínimo por fila y por columna) en lugar de
+    # construir una máscara booleana 2-D completa: dos pasadas en vez de cuatro.
+    rows_mask = arr.min(axis=1) < threshold
+    if not rows_mask.any():
         return None
-    rows = np.where(mask.any(axis=1))[0]
-    cols = np.where(mask.any(axis=0))[0]
-    top, bottom = int(rows[0]), int(rows[-1])
-    left, right = int(cols[0]), int(cols[-1])
+    # argmax sobre un arreglo booleano se detiene en el primer True
+    top = int(rows_mask.argmax())
+    bottom = rows_mask.size - 1 - int(rows_mask[::-1].argmax())
+
+    # Las columnas solo se reducen entre `top` y `bottom`: las filas en blanco de los
+    # márgenes superior e inferior no aportan contenido.
+    cols_mask = arr[top:bottom + 1].min(axis=0) < threshold
+    left = int(cols_mask.argmax()) // n
+    right = (cols_mask.size - 1 - int(cols_mask[::-1].argmax())) // n
     return left, top, right, bottom
 
 
+_CS_GRAY = fitz.csGRAY
+_CS_RGB = fitz.csRGB
+_PROBE_MAT = fitz.Matrix(_PROBE_DPI / 72.0, _PROBE_DPI / 72.0)
+
+# Documento (y matriz de rasterizado) de cada proceso de trabajo, reutilizados entre páginas.
+_worker_doc = None
+_worker_path = None
+_worker_mat = None
+
+
+def _render_bbox(
+    path: str,
+    page_index: int,
+    detect_dpi: int,
+    threshold: int,
+    color_aware: bool = False,
+    probe: bool = False
+) -> tuple:
+    """Rasteriza una página y calcula el cuadro delimitador de su contenido.
+
+    Pensada para ejecutarse en un proceso de trabajo: los objetos `fitz.Document`
+    no pueden compartirse entre procesos, por lo que cada proceso abre el archivo
+    por su cuenta (una sola vez) y lo reutiliza en las páginas siguientes.
+
+    Args:
+        path (str): Ruta al archivo PDF de entrada.
+        page_index (int): Índice de la página (base 0).
+        detect_dpi (int): Resolución de rasterización para la detección (puntos por pulgada).
+        threshold (int): Umbral para distinguir contenido de fondo (0–255).
+        color_aware (bool): Si es `True`, rasteriza en RGB en lugar de escala de grises.
+        probe (bool): Si es `True`, primero se rasteriza el centro de la página a
+                      `_PROBE_DPI`; si está vacío y la página completa a esa resolución
+                      también, la página se da por en blanco sin rasterizarla a
+                      `detect_dpi`.
+
+    Returns:
+        tuple: `(page_index, bbox_px)`, donde `bbox_px` es el resultado de
+               `find_content_bbox`, en píxeles relativos a `page.rect` (es decir, al
+               cropbox actual ya rotado según `/Rotate`).
+    """
+    global _worker_doc, _worker_path, _worker_mat
+    if _worker_doc is None or _worker_path != path:
+        _close_worker_doc()
+        _worker_doc = fitz.open(path)
+        _worker_path = path
+    zoom = detect_dpi / 72.0
+    if _worker_mat is None or _worker_mat.a != zoom:
+        _worker_mat = fitz.Matrix(zoom, zoom)
+    page = _worker_doc[page_index]
+    # Renderizar página en escala de grises (o RGB) sin canal alfa
+    colorspace = _CS_RGB if color_aware else _CS_GRAY
+    if probe and detect_dpi > _PROBE_DPI:
+        r = page.rect
+        dx, dy = r.width * _PROBE_INSET, r.height * _PROBE_INSET
+        probe_rect = fitz.Rect(r.x0 + dx, r.y0 + dy, r.x1 - dx, r.y1 - dy)
+        pix = page.get_pixmap(matrix=_PROBE_MAT, colorspace=colorspace, alpha=False, clip=probe_rect)
+        if find_content_bbox(pix, threshold=threshold) is None:
+            # El centro está vacío: confirmar a baja resolución con la página completa
+            pix = page.get_pixmap(matrix=_PROBE_MAT, colorspace=colorspace, alpha=False)
+            if find_content_bbox(pix, threshold=threshold) is None:
+                return page_index, None
+    pix = page.get_pixmap(matrix=_worker_mat, colorspace=colorspace, alpha=False)
+    bbox_px = find_content_bbox(pix, threshold=threshold)
+    return page_index, bbox_px
+
+
+def _has_own_cropbox(page: fitz.Page) -> bool:
+    """Indica si el cropbox efectivo de la página es más pequeño que su mediabox.
+
+    PyMuPDF devuelve `page.mediabox` en las coordenadas del PDF, pero `page.cropbox` en
+    las de MuPDF (eje y hacia abajo, medido desde el borde superior del mediabox), así
+    que el mediabox se lleva a ese mismo sistema antes de compararlos. Así, un mediabox
+    con origen distinto de (0, 0) o un `/CropBox` explícito igual al mediabox no cuentan
+    como recorte; un `/CropBox` heredado de un nodo `/Pages` sí.
+
+    Args:
+        page (fitz.Page): Página a revisar.
+
+    Returns:
+        bool: `True` si el cropbox difiere del mediabox (con tolerancia de 0.01 pt).
+    """
+    mb = page.mediabox
+    full = (mb.x0, 0.0, mb.x1, mb.y1 - mb.y0)
+    return any(abs(a - b) > 0.01 for a, b in zip(page.cropbox, full))
+
+
+def _close_worker_doc() -> None:
+    """Cierra el documento abierto por `_render_bbox` en este proceso, si lo hay."""
+    global _worker_doc, _worker_path
+    if _worker_doc is not None:
+        _worker_doc.close()
+    _worker_doc = None
+    _worker_path = None
+
+
 def crop_pdf(
     input_path: str,
     output_path: str,
-    dpi: int,
+    detect_dpi: int,
     threshold: int,
     margin_pt: float,
-    quiet: bool
+    quiet: bool,
+    workers: int | None = None,
+    fast_save: bool = False,
+    force: bool = False,
+    color_aware: bool = False,
+    probe_blank: bool = False
 ) -> None:
     """Recorta las páginas de un PDF eliminando márgenes en blanco.
 
-    Cada página se rasteriza a la resolución especificada (`dpi`), se detecta el
-    contenido no blanco usando un umbral de intensidad, y se ajusta el `cropbox`
+    Cada página se rasteriza a la resolución de detección (`detect_dpi`), se detecta
+    el contenido no blanco usando un umbral de intensidad, y se ajusta el `cropbox`
     de la página para ajustarse al contenido más un margen adicional.
 
     Args:
         input_path (str): Ruta al archivo PDF de entrada.
         output_path (str): Ruta donde se guardará el PDF recortado.
-        dpi (int): Resolución de rasterización (puntos por pulgada).
+        detect_dpi (int): Resolución de rasterización para la detección (puntos por pulgada).
+                          Solo afecta la precisión del cuadro delimitador: el cropbox es
+                          vectorial y el PDF de salida no se rasteriza.
         threshold (int): Umbral para distinguir contenido de fondo (0–255).
         margin_pt (float): Margen adicional a conservar alrededor del contenido, en puntos PDF.
         quiet (bool): Si es `True`, suprime la salida por consola.
+        workers (int | None): Número de procesos para rasterizar páginas en paralelo.
+                              Por defecto `os.cpu_count()`; con 1 no se crean procesos.
+        fast_save (bool): Si es `True`, guarda sin recolectar objetos no usados ni
+                          recomprimir flujos: el guardado es mucho más rápido a cambio
+                          de un archivo más grande.
+        force (bool): Si es `True`, analiza también las páginas cuyo cropbox ya difiere
+                      del mediabox (por defecto se omiten, pues suelen estar ya recortadas;
+                      ver `_has_own_cropbox`).
+        color_aware (bool): Si es `True`, rasteriza en RGB y considera contenido cualquier
+                            píxel con algún canal por debajo de `threshold`, lo que detecta
+                            colores claros que en escala de grises superan el umbral.
+        probe_blank (bool): Si es `True`, descarta las páginas en blanco con un sondeo a
+                            baja resolución antes de rasterizarlas a `detect_dpi`. Útil
+                            en documentos con muchas páginas en blanco; en el resto
+                            añade el costo del sondeo.
 
     Side Effects:
-        - Guarda un nuevo archivo PDF en `output_path`.
+        - Guarda un nuevo archivo PDF en `output_path`. Si `output_path` es el mismo
+          archivo que `input_path`, se guarda de forma incremental.
         - Imprime progreso en consola si `quiet=False`.
 
     Notes:
         - Las coordenadas en MuPDF tienen el origen en la esquina superior izquierda.
         - El margen se aplica en puntos PDF, no en píxeles.
         - Las páginas completamente en blanco se dejan sin modificar.
+        - Las páginas con un cropbox distinto del mediabox se dejan sin modificar,
+          salvo que `force=True`.
     """
     doc = fitz.open(input_path)
-    scale = 72.0 / dpi  # Conversión: píxel -> punto PDF
-
-    pages_cropped = 0
-    for i, page in enumerate(doc, start=1):
-        # Renderizar página en escala de grises sin canal alfa
-        mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)
-        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
-        bbox_px = find_content_bbox(pix, threshold=threshold)
-
-        if bbox_px is None:
+    scale = 72.0 / detect_dpi  # Conversión: píxel -> punto PDF
+
+    n_pages = doc.page_count
+    # Páginas cuyo cropbox ya difiere del mediabox probablemente se recortaron antes:
+    # se omiten sin rasterizarlas, salvo que se pida `force`.
+    pending = []
+    for idx, page in enumerate(doc):
+        if not force and _has_own_cropbox(page):
             if not quiet:
-                print(f"[{i}/{len(doc)}] Página en blanco aparente: sin recorte.")
+                print(f"[{idx + 1}/{n_pages}] Ya tiene un cropbox propio: se omite (use --force).")
             continue
-
-        left_px, top_px, right_px, bottom_px = bbox_px
-
-        # Convertir a puntos PDF y aplicar margen
-        x0 = max(0.0, left_px * scale - margin_pt)
-        y0 = max(0.0, top_px * scale - margin_pt)
-        x1 = min(page.rect.width, (right_px + 1) * scale + margin_pt)
-        y1 = min(page.rect.height, (bottom_px + 1) * scale + margin_pt)
-
-        # Validar rectángulo resultante
-        if x1 <= x0 or y1 <= y0:
+        pending.append(idx)
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    if workers == 1:
+        results = map(
+            _render_bbox, repeat(input_path), pending, repeat(detect_dpi), repeat(threshold),
+            repeat(color_aware), repeat(probe_blank)
+        )
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(
+            _render_bbox, repeat(input_path), pending, repeat(detect_dpi), repeat(threshold),
+            repeat(color_aware), repeat(probe_blank), chunksize=max(1, len(pending) // (4 * workers))
+        )
+
+    crops = []  # (índice de página, nuevo cropbox)
+    try:
+        for idx, bbox_px in results:
+            i = idx + 1
+            if bbox_px is None:
+                if not quiet:
+                    print(f"[{i}/{n_pages}] Página en blanco aparente: sin recorte.")
+                continue
+
+            left_px, top_px, right_px, bottom_px = bbox_px
+
+            # Convertir a puntos PDF y aplicar margen, en el espacio de `page.rect`
+            # (el del rasterizado: cropbox actual, ya rotado según `/Rotate`)
+            page = doc[idx]
+            page_w, page_h = page.rect.width, page.rect.height
+            x0 = max(0.0, left_px * scale - margin_pt)
+            y0 = max(0.0, top_px * scale - margin_pt)
+            x1 = min(page_w, (right_px + 1) * scale + margin_pt)
+            y1 = min(page_h, (bottom_px + 1) * scale + margin_pt)
+
+            # Validar rectángulo resultante
+            if x1 <= x0 or y1 <= y0:
+                if not quiet:
+                    print(f"[{i}/{n_pages}] Bounding box degenerado, se omite.")
+                continue
+
+            # `set_cropbox` espera coordenadas sin rotar, relativas al mediabox: deshacer
+            # la rotación y desplazar al origen del cropbox actual
+            new_rect = fitz.Rect(x0, y0, x1, y1) * page.derotation_matrix
+            new_rect = new_rect + (page.cropbox.x0, page.cropbox.y0) * 2
+            crops.append((idx, new_rect))
             if not quiet:
-                print(f"[{i}/{len(doc)}] Bounding box degenerado, se omite.")
-            continue
-
-        new_rect = fitz.Rect(x0, y0, x1, y1)
-        page.set_cropbox(new_rect)
-        pages_cropped += 1
-        if not quiet:
-            print(f"[{i}/{len(doc)}] Recortada a {new_rect} (margen {margin_pt:.2f} pt).")
-
-    if pages_cropped == 0 and not quiet:
-        print("No se aplicaron recortes. ¿Umbral muy bajo/alto o páginas realmente en blanco?")
-
-    doc.save(output_path, garbage=3, deflate=True)
+                print(f"[{i}/{n_pages}] Recortada a {new_rect} (margen {margin_pt:.2f} pt).")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        else:
+            # Sin procesos de trabajo, el documento se abrió en este proceso; se
+            # cierra para no reutilizar una versión obsoleta en la siguiente llamada.
+            _close_worker_doc()
+
+    # Aplicar todos los recortes juntos, ya fuera de la etapa de rasterizado
+    for idx, rect in crops:
+        doc[idx].set_cropbox(rect)
+
+    if not crops and not quiet:
+        if not pending:
+            print("No se aplicaron recortes: todas las páginas ya tenían un cropbox propio "
+                  "(use --force para recortarlas de nuevo).")
+        else:
+            print("No se aplicaron recortes. ¿Umbral muy bajo/alto o páginas realmente en blanco?")
+
+    same_file = os.path.exists(output_path) and os.path.samefile(input_path, output_path)
+    if same_file and doc.can_save_incrementally():
+        # Solo cambiaron los cropbox: basta con anexar los objetos modificados
+        doc.save(input_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+    elif fast_save:
+        doc.save(output_path, garbage=0, deflate=False)
+    else:
+        doc.save(output_path, garbage=3, deflate=True)
     doc.close()
     if not quiet:
         print(f"Guardado: {output_path}")
@@ -193,10 +395,17 @@ def main() -> None:
     Argumentos de línea de comandos:
         input (str): Archivo PDF de entrada.
         -o, --output (str, opcional): Archivo de salida. Por defecto: `<input>_cropped.pdf`.
-        --dpi (int, opcional): DPI para rasterización. Por defecto: 200.
+        --detect-dpi (int, opcional): DPI para la detección de contenido. Por defecto: 72.
+            `--dpi` se acepta como alias (oculto) por compatibilidad.
         --threshold (int, opcional): Umbral de detección de contenido (0–255). Por defecto: 245.
         --margin (str, opcional): Margen adicional (admite unidades: pt, mm, cm, in, px). Por defecto: "4mm".
+            Los `px` se interpretan a 200 DPI, sea cual sea `--detect-dpi`.
         --quiet (flag): Suprime mensajes de progreso.
+        --workers (int, opcional): Procesos para rasterizar en paralelo. Por defecto: `os.cpu_count()`.
+        --fast-save (flag): Guarda sin limpieza ni recompresión (más rápido, archivo más grande).
+        --force (flag): Analiza también las páginas que ya tienen un cropbox propio.
+        --color-aware (flag): Detecta en RGB: basta con que un canal quede bajo el umbral.
+        --probe-blank (flag): Descarta páginas en blanco con un sondeo previo a baja resolución.
 
     Salidas:
         - Archivo PDF recortado.
@@ -211,21 +420,50 @@ def main() -> None:
     )
     ap.add_argument("input", help="PDF de entrada")
     ap.add_argument("-o", "--output", default=None, help="PDF de salida (por defecto: *_cropped.pdf)")
-    ap.add_argument("--dpi", type=int, default=200, help="DPI para rasterizado (por defecto: 200)")
+    ap.add_argument(
+        "--detect-dpi", type=int, default=72,
+        help="DPI para rasterizar al detectar el contenido (por defecto: 72)"
+    )
+    ap.add_argument("--dpi", type=int, dest="detect_dpi", help=argparse.SUPPRESS)
     ap.add_argument(
         "--threshold", type=int, default=245,
         help="Umbral 0–255: menor es 'contenido'. 245 suele ir bien (por defecto: 245)"
     )
     ap.add_argument(
         "--margin", default="4mm",
-        help="Margen extra a conservar (pt, mm, cm, in, px). Por defecto: 4mm"
+        help="Margen extra a conservar (pt, mm, cm, in, px a 200 DPI). Por defecto: 4mm"
     )
     ap.add_argument("--quiet", action="store_true", help="Menos salida por consola")
+    ap.add_argument(
+        "--workers", type=int, default=None,
+        help="Procesos para rasterizar páginas en paralelo (por defecto: núcleos disponibles)"
+    )
+    ap.add_argument(
+        "--fast-save", action="store_true",
+        help="Guardado rápido sin limpieza ni recompresión (archivo más grande)"
+    )
+    ap.add_argument(
+        "--force", action="store_true",
+        help="Recortar también páginas que ya tienen un cropbox distinto del mediabox"
+    )
+    ap.add_argument(
+        "--color-aware", action="store_true",
+        help="Detectar en color: un píxel es contenido si algún canal RGB es menor que el umbral"
+    )
+    ap.add_argument(
+        "--probe-blank", action="store_true",
+        help="Descartar páginas en blanco con un sondeo previo a baja resolución "
+             "(útil si hay muchas páginas en blanco)"
+    )
     args = ap.parse_args()
 
     out = args.output or re.sub(r"\.pdf$", "", args.input, flags=re.I) + "_cropped.pdf"
+    if args.detect_dpi < 1:
+        print("El --detect-dpi debe ser positivo.", file=sys.stderr)
+        sys.exit(2)
+
     try:
-        margin_pt = parse_length_to_points(args.margin, dpi=args.dpi)
+        margin_pt = parse_length_to_points(args.margin, dpi=_PX_DPI)
     except Exception as e:
         print(f"Error en --margin: {e}", file=sys.stderr)
         sys.exit(2)
@@ -234,7 +472,16 @@ def main() -> None:
         print("El --threshold debe estar entre 0 y 255.", file=sys.stderr)
         sys.exit(2)
 
-    crop_pdf(args.input, out, dpi=args.dpi, threshold=args.threshold, margin_pt=margin_pt, quiet=args.quiet)
+    if args.workers is not None and args.workers < 1:
+        print("El --workers debe ser al menos 1.", file=sys.stderr)
+        sys.exit(2)
+
+    crop_pdf(
+        args.input, out, detect_dpi=args.detect_dpi, threshold=args.threshold, margin_pt=margin_pt,
+        quiet=args.quiet, workers=args.workers,
+        fast_save=args.fast_save, force=args.force, color_aware=args.color_aware,
+        probe_blank=args.probe_blank
+    )
 
 
 if __name__ == "__main__":